@@ -1,10 +1,30 @@
+import argparse
+import random
+
 from sudoku.ui.game import Game
+from sudoku.ui.script import EventRecorder
 
 
 def main() -> None:
-    game = Game()
+    parser = argparse.ArgumentParser(description="Play Sudoku.")
+    parser.add_argument("--record", help="save the input events to this script file")
+    parser.add_argument("--seed", type=int, help="random seed of the board")
+    args = parser.parse_args()
+
+    seed = args.seed
+    if seed is None and args.record:
+        # A recorded session must be replayable on the same board
+        seed = random.randrange(2**32)
+    if seed is not None:
+        random.seed(seed)
+
+    recorder = EventRecorder(seed=seed) if args.record else None
+    game = Game(event_source=recorder)
     game.play()
 
+    if recorder:
+        recorder.save(args.record)
+
 
 if __name__ == "__main__":
     main()
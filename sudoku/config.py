@@ -10,6 +10,7 @@ class Color(Enum):
     WHITE = (225, 225, 225)
     BUTTON = (100, 149, 237)
     BUTTON_HOVER = (75, 119, 190)
+    RED = (255, 0, 0)
 
 
 @dataclass
@@ -22,6 +23,8 @@ class Config:
     TIMER_FONT_SIZE: int = 16
     GAME_OVER_FONT_SIZE: int = 32
     ANIMATION_DELAY: int = 500
+    GAME_OVER_DELAY: int = 2000
+    ORACLE_BUDGET: float = 0.008
     FPS: int = 60
     FONT_PATH: str = "assets/fonts/OpenSans-Medium.ttf"
 
@@ -0,0 +1,125 @@
+import os
+
+# Select SDL's headless drivers before the game module initializes pygame
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+import pygame
+
+from sudoku.ui.game import Game
+from sudoku.ui.script import ScriptedEvent, ScriptPlayer, load_script, synthetic_script
+
+
+@dataclass
+class ReplayReport:
+    """
+    Performance figures of a replay.
+    """
+
+    frame_times: list[float]
+    cpu_time: float
+    wall_time: float
+
+    @property
+    def frames(self) -> int:
+        """
+        Number of frames rendered.
+        """
+        return len(self.frame_times)
+
+    def percentile(self, q: float) -> float:
+        """
+        Get a frame time percentile, using the nearest-rank method.
+
+        :param float q: percentile in the range [0, 100]
+        :return float: frame time in milliseconds
+        """
+        if not self.frame_times:
+            return 0.0
+        ordered = sorted(self.frame_times)
+        rank = max(1, math.ceil(q / 100 * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+    def __str__(self) -> str:
+        return (
+            f"frames rendered: {self.frames}\n"
+            f"frame time p50: {self.percentile(50):.2f} ms\n"
+            f"frame time p90: {self.percentile(90):.2f} ms\n"
+            f"frame time p99: {self.percentile(99):.2f} ms\n"
+            f"frame time max: {self.percentile(100):.2f} ms\n"
+            f"cpu time: {self.cpu_time:.3f} s\n"
+            f"wall time: {self.wall_time:.3f} s"
+        )
+
+
+def replay(
+    script: Iterable[ScriptedEvent] | None = None, seed: int | None = 0
+) -> ReplayReport:
+    """
+    Play a script into a headless game and measure it.
+
+    The game runs under SDL's dummy video driver, without frame rate cap or
+    animation delays. Each frame time is the time elapsed since the previous
+    display flip, so event handling, solving and the Solve animation are
+    included. Without a script, `synthetic_script` is used.
+
+    :param Iterable[ScriptedEvent] | None script: events to replay, defaults to None
+    :param int | None seed: random seed of the generated board, defaults to 0
+    :return ReplayReport: frame times and CPU time of the replay
+    """
+    if seed is not None:
+        random.seed(seed)
+    player = ScriptPlayer([])
+    game = Game(event_source=player)
+    game.fps = 0
+    game.animation_delay = 0
+    game.game_over_delay = 0
+    player.events = list(script) if script is not None else synthetic_script(game.board)
+
+    frame_times = []
+    flip = pygame.display.flip
+    last_flip = 0.0
+
+    def timed_flip() -> None:
+        nonlocal last_flip
+        flip()
+        now = time.perf_counter()
+        frame_times.append((now - last_flip) * 1000)
+        last_flip = now
+
+    pygame.display.flip = timed_flip
+    try:
+        cpu_start = time.process_time()
+        wall_start = last_flip = time.perf_counter()
+        game.play()
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+    finally:
+        pygame.display.flip = flip
+
+    return ReplayReport(frame_times, cpu_time, wall_time)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a Sudoku input script headlessly.")
+    parser.add_argument("script", nargs="?", help="script recorded with main.py --record")
+    parser.add_argument(
+        "--seed", type=int, help="random seed of the board, defaults to the script's seed or 0"
+    )
+    args = parser.parse_args()
+
+    script, seed = load_script(args.script) if args.script else (None, None)
+    if args.seed is not None:
+        seed = args.seed
+    print(replay(script, seed=0 if seed is None else seed))
+
+
+if __name__ == "__main__":
+    main()
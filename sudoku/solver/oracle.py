@@ -0,0 +1,211 @@
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from sudoku.config import GameConfig
+from sudoku.models.board import Board, Coordinates
+
+
+ALL_DIGITS = 0b1111111110
+MAX_WITNESSES = 8
+
+
+class _Timeout(Exception):
+    """
+    Raised when a search exceeds its time budget.
+    """
+
+
+@dataclass
+class OracleResult:
+    """
+    Result of a solvability check.
+
+    `complete` is False when the check ran out of time, in which case
+    `solvable` is None if it was not decided yet and `wrong` only holds the
+    entries proven wrong so far.
+    """
+
+    solvable: bool | None
+    wrong: set[Coordinates] = field(default_factory=set)
+    complete: bool = True
+
+
+class SolvabilityOracle:
+    """
+    Check whether the player entries still lead to a solution.
+
+    Search state is reused across moves: every solution found is kept as a
+    witness, a grid agreeing with a witness is solvable without searching,
+    the verdict for each single entry is memoized, and new searches try the
+    digits of the latest witness first. Only the latest witnesses are kept.
+    A check that ran out of time can be retried on the same grid and resumes
+    from the verdicts already proven.
+    """
+
+    def __init__(self, board: Board, budget: float = GameConfig.ORACLE_BUDGET) -> None:
+        """
+        Initialize the oracle from the givens of the board.
+
+        :param Board board: board whose initial cells are the givens
+        :param float budget: time budget of a check in seconds, defaults to GameConfig.ORACLE_BUDGET
+        """
+        self.givens = {cell: board.grid[cell] for cell in board.initial_cells}
+        self.budget = budget
+        self.witnesses = deque([dict(board.solution)], maxlen=MAX_WITNESSES)
+        self._entry_memo: dict[tuple[Coordinates, int], bool] = {}
+        self._grid_memo: tuple[frozenset, bool] | None = None
+        self._deadline = 0.0
+        self._nodes = 0
+
+    def check(self, grid: dict[Coordinates, int]) -> OracleResult:
+        """
+        Check the current grid.
+
+        An entry is reported wrong when no solution of the givens contains it.
+
+        :param dict[Coordinates, int] grid: givens and player entries, 0 for empty cells
+        :return OracleResult: whether the grid is solvable and the wrong entries
+        """
+        self._deadline = time.perf_counter() + self.budget
+        self._nodes = 0
+        entries = {
+            cell: digit
+            for cell, digit in grid.items()
+            if digit != 0 and cell not in self.givens
+        }
+
+        key = frozenset(entries.items())
+        solvable = None
+        try:
+            if self._grid_memo and self._grid_memo[0] == key:
+                solvable = self._grid_memo[1]
+            else:
+                solvable = self._solve({**self.givens, **entries}) is not None
+                self._grid_memo = (key, solvable)
+            if solvable:
+                return OracleResult(True)
+
+            for cell, digit in entries.items():
+                self._is_wrong(cell, digit)
+        except _Timeout:
+            return OracleResult(solvable, self._memoized_wrong(entries), complete=False)
+        return OracleResult(False, self._memoized_wrong(entries))
+
+    def _memoized_wrong(self, entries: dict[Coordinates, int]) -> set[Coordinates]:
+        """
+        Get the entries already proven wrong.
+
+        :param dict[Coordinates, int] entries: player entries
+        :return set[Coordinates]: cells of the entries proven wrong
+        """
+        return {
+            cell
+            for cell, digit in entries.items()
+            if self._entry_memo.get((cell, digit), False)
+        }
+
+    def _is_wrong(self, cell: Coordinates, digit: int) -> bool:
+        """
+        Check whether the givens plus a single entry have no solution.
+
+        :param Coordinates cell: (row, col) of the entry
+        :param int digit: digit of the entry
+        :return bool: True if the entry is provably wrong, False otherwise
+        """
+        key = (cell, digit)
+        if key not in self._entry_memo:
+            self._entry_memo[key] = self._solve({**self.givens, cell: digit}) is None
+        return self._entry_memo[key]
+
+    def _solve(self, fixed: dict[Coordinates, int]) -> dict[Coordinates, int] | None:
+        """
+        Find a solution extending the fixed digits.
+
+        :param dict[Coordinates, int] fixed: fixed digits
+        :raises _Timeout: if the search exceeds the time budget
+        :return dict[Coordinates, int] | None: a solution, or None if there is none
+        """
+        self._check_deadline()
+        for witness in reversed(self.witnesses):
+            self._check_deadline()
+            if all(witness[cell] == digit for cell, digit in fixed.items()):
+                return witness
+
+        rows, cols, boxes = [0] * 9, [0] * 9, [0] * 9
+        for (row, col), digit in fixed.items():
+            bit = 1 << digit
+            box = row // 3 * 3 + col // 3
+            if (rows[row] | cols[col] | boxes[box]) & bit:
+                return None
+            rows[row] |= bit
+            cols[col] |= bit
+            boxes[box] |= bit
+
+        grid = dict(fixed)
+        empty = [
+            (row, col) for row in range(9) for col in range(9) if (row, col) not in fixed
+        ]
+        hint = self.witnesses[-1]
+
+        def _search() -> bool:
+            self._nodes += 1
+            if self._nodes % 256 == 0:
+                self._check_deadline()
+
+            # Pick the empty cell with the fewest candidates
+            best, best_index, best_count = 0, -1, 10
+            for index, (row, col) in enumerate(empty):
+                if (row, col) in grid:
+                    continue
+                candidates = ALL_DIGITS & ~(
+                    rows[row] | cols[col] | boxes[row // 3 * 3 + col // 3]
+                )
+                count = candidates.bit_count()
+                if count < best_count:
+                    best, best_index, best_count = candidates, index, count
+                    if count <= 1:
+                        break
+            if best_index == -1:
+                return True
+            if best_count == 0:
+                return False
+
+            row, col = empty[best_index]
+            box = row // 3 * 3 + col // 3
+            digits = [digit for digit in range(1, 10) if best >> digit & 1]
+            preferred = hint[row, col]
+            if preferred in digits:
+                digits.remove(preferred)
+                digits.insert(0, preferred)
+
+            for digit in digits:
+                bit = 1 << digit
+                grid[row, col] = digit
+                rows[row] |= bit
+                cols[col] |= bit
+                boxes[box] |= bit
+                if _search():
+                    return True
+                rows[row] &= ~bit
+                cols[col] &= ~bit
+                boxes[box] &= ~bit
+                del grid[row, col]
+            return False
+
+        if not _search():
+            return None
+        self.witnesses.append(grid)
+        return grid
+
+    def _check_deadline(self) -> None:
+        """
+        Stop the check once its time budget is spent.
+
+        :raises _Timeout: if the deadline has passed
+        """
+        if time.perf_counter() > self._deadline:
+            raise _Timeout
+
+
+__all__ = ["OracleResult", "SolvabilityOracle"]
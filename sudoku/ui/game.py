@@ -1,11 +1,12 @@
 import time
 from enum import Enum
-from typing import Tuple
+from typing import Callable, Tuple
 
 import pygame
 import pygame.freetype
 
 from sudoku.models.board import Board, Coordinates
+from sudoku.solver.oracle import OracleResult, SolvabilityOracle
 from sudoku.solver.solver import SudokuSolver
 from sudoku.config import GameConfig, Color
 from sudoku.ui.components import Button, Grid
@@ -21,12 +22,23 @@ class GameState:
 
 
 class Game:
-    def __init__(self) -> None:
+    def __init__(
+        self, event_source: Callable[[], list[pygame.event.Event]] | None = None
+    ) -> None:
+        """
+        Initialize the game window and a new board.
+
+        :param event_source: callable returning the pending events, defaults to pygame.event.get
+        """
         pygame.init()
         pygame.display.set_caption("Sudoku")
         
         self.state = GameState.PLAYING
         self.clock = pygame.time.Clock()
+        self.fps = GameConfig.FPS
+        self.animation_delay = GameConfig.ANIMATION_DELAY
+        self.game_over_delay = GameConfig.GAME_OVER_DELAY
+        self._event_source = event_source or pygame.event.get
         self._resolution = GameConfig.WINDOW_SIZE  # Ajout de l'attribut manquant
         self._padding = GameConfig.PADDING
         self._button_height = GameConfig.BUTTON_HEIGHT
@@ -37,6 +49,8 @@ class Game:
         
         # Game state
         self.board = Board()
+        self.oracle = SolvabilityOracle(self.board)
+        self._oracle_result = OracleResult(True)
         self.solve_button = Button(
             GameConfig.PADDING, 
             GameConfig.PADDING, 
@@ -82,6 +96,14 @@ class Game:
             self._animate_solution(solution)
         self.state = GameState.PLAYING
 
+    def _check_solvability(self) -> None:
+        """
+        Check whether the player entries still lead to a solution.
+
+        A check running out of its time budget is retried on the next frames.
+        """
+        self._oracle_result = self.oracle.check(self.board.grid)
+
     def draw_digit(self, pos: Tuple[int, int], digit: int, is_initial: bool = False) -> None:
         """
         Dessine un chiffre à une position donnée
@@ -103,7 +125,11 @@ class Game:
             allowed = self.board.get_allowed(i, j)
             self.board.grid[i, j] = current
             
-            color = (0, 0, 255) if digit in allowed else (255, 0, 0)
+            color = (
+                (0, 0, 255)
+                if digit in allowed and pos not in self._oracle_result.wrong
+                else (255, 0, 0)
+            )
         
         text = font.render(str(digit), True, color)
         width, height = text.get_size()
@@ -242,6 +268,23 @@ class Game:
                             is_initial=(i, j) in self.board.initial_cells
                         )
 
+        def _draw_status() -> None:
+            """
+            Draw a warning when the player entries lead to no solution.
+            """
+            if self._oracle_result.solvable is not False:
+                return
+            font = pygame.font.Font(GameConfig.FONT_PATH, GameConfig.TIMER_FONT_SIZE)
+            text = font.render("Unsolvable", True, Color.RED.value, Color.WHITE.value)
+            width, height = text.get_size()
+            self._screen.blit(
+                text,
+                (
+                    self._padding * 2 + GameConfig.BUTTON_WIDTH,
+                    self._padding // 2 + self._stats_padding // 2 - height // 2,
+                ),
+            )
+
         def _draw_time() -> None:
             """
             Draw the time on the screen.
@@ -275,10 +318,11 @@ class Game:
         _draw_cells()
         _draw_grid()
         _draw_digits()
+        _draw_status()
         _draw_time()
 
         pygame.display.flip()
-        self.clock.tick(60)
+        self.clock.tick(self.fps)
 
     def play(self) -> bool:
         # Setup initial display
@@ -298,11 +342,11 @@ class Game:
                 self.show_game_over("You Win!")
                 return True
 
-            for event in pygame.event.get():
+            for event in self._event_source():
                 if event.type == pygame.QUIT:
                     return True
 
-                pos = pygame.mouse.get_pos()
+                pos = getattr(event, "pos", None) or pygame.mouse.get_pos()
 
                 # Gestion du survol
                 if event.type == pygame.MOUSEMOTION:
@@ -331,10 +375,12 @@ class Game:
                         solver = SudokuSolver(self.board)
                         solution = solver.solve()
                         if solution:
+                            # The solution extends the current entries
+                            self._oracle_result = OracleResult(True)
                             # Animate the solved digits
                             for (row, col), value in solution.items():
                                 if self.board.grid[row, col] == 0:
-                                    pygame.time.wait(500)  # Delay in milliseconds
+                                    pygame.time.wait(self.animation_delay)  # Delay in milliseconds
                                     self.board.grid[row, col] = value
                                     self.draw_digit((row, col), value, is_initial=False)
                                     pygame.display.flip()
@@ -366,13 +412,19 @@ class Game:
                     if event.key in [pygame.K_BACKSPACE, pygame.K_DELETE]:
                         if (row, col) not in self.board.initial_cells:
                             self.board.grid[row, col] = 0
+                            self._check_solvability()
                             self.update()
                     elif event.unicode.isdigit() and event.unicode != '0':
                         if (row, col) not in self.board.initial_cells:
                             digit = int(event.unicode)
                             self.board.grid[row, col] = digit
+                            self._check_solvability()
                             self.update()
 
+            # Reprise d'une vérification interrompue par son budget
+            if not self._oracle_result.complete:
+                self._check_solvability()
+
             # Mise à jour de l'affichage
             if self._hovered and not self._selected_cell:
                 self.update(hover=self._hovered)
@@ -401,4 +453,4 @@ class Game:
         )
         self._screen.blit(time_text, time_text_rect)
         pygame.display.flip()        
-        pygame.time.wait(2000)
+        pygame.time.wait(self.game_over_delay)
@@ -0,0 +1,182 @@
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+import pygame
+
+from sudoku.config import GameConfig
+from sudoku.models.board import Board, Coordinates
+
+
+@dataclass
+class ScriptedEvent:
+    """
+    A pygame event scheduled at a given time of a script.
+    """
+
+    time: float
+    type: int
+    attrs: dict = field(default_factory=dict)
+
+    def to_event(self) -> pygame.event.Event:
+        """
+        Build the pygame event.
+
+        :return pygame.event.Event: event to feed to the game
+        """
+        attrs = {
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in self.attrs.items()
+        }
+        return pygame.event.Event(self.type, attrs)
+
+
+def save_script(
+    events: Iterable[ScriptedEvent], path: str, seed: int | None = None
+) -> None:
+    """
+    Save a script as JSON lines, after a header line holding the board seed.
+
+    :param Iterable[ScriptedEvent] events: events to save
+    :param str path: output file
+    :param int | None seed: random seed of the board, defaults to None
+    """
+    with open(path, "w") as file:
+        file.write(json.dumps({"seed": seed}) + "\n")
+        for event in events:
+            file.write(
+                json.dumps({"time": event.time, "type": event.type, "attrs": event.attrs})
+                + "\n"
+            )
+
+
+def load_script(path: str) -> tuple[list[ScriptedEvent], int | None]:
+    """
+    Load a script saved by `save_script`.
+
+    :param str path: input file
+    :return tuple[list[ScriptedEvent], int | None]: scripted events, in order, and the board seed
+    """
+    with open(path) as file:
+        lines = [json.loads(line) for line in file if line.strip()]
+    seed = lines.pop(0)["seed"] if lines and "seed" in lines[0] else None
+    return [ScriptedEvent(**line) for line in lines], seed
+
+
+class EventRecorder:
+    """
+    Event source recording every event it returns, with its time in milliseconds.
+
+    The seed of the board is saved along with the events, so the session can
+    be replayed on the same board.
+    """
+
+    def __init__(
+        self,
+        source: Callable[[], list[pygame.event.Event]] = pygame.event.get,
+        seed: int | None = None,
+    ) -> None:
+        self.source = source
+        self.seed = seed
+        self.events: list[ScriptedEvent] = []
+        self._start = time.perf_counter()
+
+    def __call__(self) -> list[pygame.event.Event]:
+        events = self.source()
+        now = (time.perf_counter() - self._start) * 1000
+        for event in events:
+            attrs = {
+                key: value
+                for key, value in event.dict.items()
+                if isinstance(value, (int, float, str, tuple)) or value is None
+            }
+            self.events.append(ScriptedEvent(round(now, 3), event.type, attrs))
+        return events
+
+    def save(self, path: str) -> None:
+        """
+        Save the recorded events.
+
+        :param str path: output file
+        """
+        save_script(self.events, path, seed=self.seed)
+
+
+class ScriptPlayer:
+    """
+    Event source replaying a script as fast as possible.
+
+    Events sharing the same time are returned by the same poll, so each
+    recorded batch becomes one frame. A QUIT event ends the script.
+    """
+
+    def __init__(self, events: Iterable[ScriptedEvent]) -> None:
+        self.events = list(events)
+        self._index = 0
+
+    def __call__(self) -> list[pygame.event.Event]:
+        if self._index >= len(self.events):
+            return [pygame.event.Event(pygame.QUIT)]
+
+        batch_time = self.events[self._index].time
+        batch = []
+        while (
+            self._index < len(self.events)
+            and self.events[self._index].time == batch_time
+        ):
+            batch.append(self.events[self._index].to_event())
+            self._index += 1
+        return batch
+
+
+def cell_center(cell: Coordinates) -> tuple[int, int]:
+    """
+    Get the screen position of the center of a cell.
+
+    :param Coordinates cell: (row, col) of the cell
+    :return tuple[int, int]: (x, y) position on the screen
+    """
+    row, col = cell
+    x, y = GameConfig.WINDOW_SIZE
+    offset_y = GameConfig.BUTTON_HEIGHT + GameConfig.PADDING * 2
+    return (
+        col * x // 9 + x // 18 + GameConfig.PADDING,
+        row * y // 9 + y // 18 + offset_y,
+    )
+
+
+def synthetic_script(board: Board, solve: bool = True) -> list[ScriptedEvent]:
+    """
+    Build a script covering the hover, selection, typing and Solve paths.
+
+    The mouse sweeps over every cell, then each empty cell is selected,
+    filled with a digit and cleared again. The Solve button is clicked last.
+
+    :param Board board: board the script is played against
+    :param bool solve: whether to click the Solve button, defaults to True
+    :return list[ScriptedEvent]: scripted events, one frame apart
+    """
+    frame = 1000 / GameConfig.FPS
+    events = []
+
+    def add(type: int, **attrs) -> None:
+        events.append(ScriptedEvent(round(len(events) * frame, 3), type, attrs))
+
+    for cell in board.grid:
+        add(pygame.MOUSEMOTION, pos=cell_center(cell), rel=(0, 0), buttons=(0, 0, 0))
+
+    empty = [cell for cell in board.grid if cell not in board.initial_cells]
+    for index, cell in enumerate(empty):
+        digit = str(index % 9 + 1)
+        add(pygame.MOUSEBUTTONDOWN, pos=cell_center(cell), button=1)
+        add(pygame.KEYDOWN, key=ord(digit), unicode=digit, mod=0, scancode=0)
+        add(pygame.KEYDOWN, key=pygame.K_BACKSPACE, unicode="\b", mod=0, scancode=0)
+
+    if solve:
+        button = (
+            GameConfig.PADDING + GameConfig.BUTTON_WIDTH // 2,
+            GameConfig.PADDING + GameConfig.BUTTON_HEIGHT // 2,
+        )
+        add(pygame.MOUSEBUTTONDOWN, pos=button, button=1)
+    return events
@@ -0,0 +1,5 @@
+import os
+
+# Run pygame headless, whatever module initializes it first
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
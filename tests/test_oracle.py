@@ -0,0 +1,124 @@
+import random
+
+import pytest
+
+from sudoku.models.board import Board
+from sudoku.solver import oracle
+from sudoku.solver.oracle import SolvabilityOracle
+from sudoku.solver.solver import SudokuSolver
+
+
+@pytest.fixture
+def board() -> Board:
+    random.seed(0)
+    return Board()
+
+
+def empty_cells(board: Board) -> list[tuple[int, int]]:
+    return [cell for cell in board.grid if cell not in board.initial_cells]
+
+
+def has_solution(board: Board, grid: dict) -> bool:
+    original = board.grid
+    board.grid = grid
+    try:
+        return bool(SudokuSolver(board).solve())
+    finally:
+        board.grid = original
+
+
+def conflicting_grid(board: Board) -> tuple[dict, tuple[int, int]]:
+    """
+    Fill two empty cells of a row with the same digit.
+    """
+    for row in range(9):
+        cells = [(row, col) for col in range(9) if board.grid[row, col] == 0]
+        if len(cells) >= 2:
+            first, second = cells[:2]
+            grid = dict(board.grid)
+            grid[first] = grid[second] = board.solution[first]
+            return grid, second
+    raise ValueError("no row with two empty cells")
+
+
+def test_solution_entries_are_solvable(board):
+    grid = dict(board.grid)
+    for cell in empty_cells(board)[:10]:
+        grid[cell] = board.solution[cell]
+
+    result = SolvabilityOracle(board).check(grid)
+
+    assert result.solvable is True
+    assert result.wrong == set()
+    assert result.complete
+
+
+def test_conflicting_entries_are_unsolvable(board):
+    grid, second = conflicting_grid(board)
+
+    result = SolvabilityOracle(board).check(grid)
+
+    assert result.solvable is False
+    assert second in result.wrong
+    assert result.complete
+
+
+def test_matches_cp_sat_on_random_entries():
+    for seed in range(3):
+        random.seed(seed)
+        board = Board()
+        checker = SolvabilityOracle(board)
+        grid = dict(board.grid)
+        for cell in random.sample(empty_cells(board), 10):
+            grid[cell] = random.randint(1, 9)
+            result = checker.check(grid)
+
+            assert result.solvable == has_solution(board, grid)
+            for entry in empty_cells(board):
+                if grid[entry] == 0 or result.solvable:
+                    continue
+                alone = {**board.grid, entry: grid[entry]}
+                assert (entry in result.wrong) == (not has_solution(board, alone))
+
+
+def test_witness_answers_without_searching(board):
+    checker = SolvabilityOracle(board)
+    grid = dict(board.grid)
+    for cell in empty_cells(board)[:5]:
+        grid[cell] = board.solution[cell]
+
+    assert checker.check(grid).solvable is True
+    assert checker._nodes == 0
+    assert len(checker.witnesses) == 1
+
+
+def test_timeout_is_reported(board):
+    grid = dict(board.grid)
+    cell = empty_cells(board)[0]
+    grid[cell] = board.solution[cell] % 9 + 1
+
+    result = SolvabilityOracle(board, budget=0.0).check(grid)
+
+    assert result.solvable is None
+    assert not result.complete
+
+
+def test_timeout_keeps_proven_verdict(board, monkeypatch):
+    grid, second = conflicting_grid(board)
+    checker = SolvabilityOracle(board)
+
+    def timeout(*args):
+        raise oracle._Timeout
+
+    monkeypatch.setattr(checker, "_is_wrong", timeout)
+    result = checker.check(grid)
+
+    assert result.solvable is False
+    assert not result.complete
+
+    monkeypatch.undo()
+    result = checker.check(grid)
+
+    assert result.solvable is False
+    assert second in result.wrong
+    assert result.complete
@@ -0,0 +1,67 @@
+import random
+
+import pygame
+
+from sudoku.models.board import Board
+from sudoku.replay import ReplayReport, replay
+from sudoku.ui.script import (
+    ScriptedEvent,
+    ScriptPlayer,
+    load_script,
+    save_script,
+    synthetic_script,
+)
+
+
+def test_script_round_trip(tmp_path):
+    path = tmp_path / "script.jsonl"
+    events = [
+        ScriptedEvent(0.0, pygame.MOUSEMOTION, {"pos": (12, 34), "buttons": (0, 0, 0)}),
+        ScriptedEvent(16.5, pygame.KEYDOWN, {"key": pygame.K_5, "unicode": "5"}),
+    ]
+    save_script(events, str(path), seed=42)
+
+    loaded, seed = load_script(str(path))
+    assert seed == 42
+    assert [(event.time, event.type) for event in loaded] == [
+        (0.0, pygame.MOUSEMOTION),
+        (16.5, pygame.KEYDOWN),
+    ]
+
+    motion = loaded[0].to_event()
+    assert motion.pos == (12, 34)
+    assert motion.buttons == (0, 0, 0)
+    assert loaded[1].to_event().unicode == "5"
+
+
+def test_player_batches_events_by_time():
+    player = ScriptPlayer(
+        [
+            ScriptedEvent(0.0, pygame.MOUSEMOTION, {"pos": (1, 1)}),
+            ScriptedEvent(0.0, pygame.MOUSEBUTTONDOWN, {"pos": (1, 1), "button": 1}),
+            ScriptedEvent(10.0, pygame.KEYDOWN, {"key": pygame.K_1, "unicode": "1"}),
+        ]
+    )
+
+    assert [event.type for event in player()] == [pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN]
+    assert [event.type for event in player()] == [pygame.KEYDOWN]
+    assert [event.type for event in player()] == [pygame.QUIT]
+
+
+def test_percentile_nearest_rank():
+    report = ReplayReport([float(value) for value in range(1, 11)], 0.0, 0.0)
+
+    assert report.percentile(50) == 5.0
+    assert report.percentile(91) == 10.0
+    assert report.percentile(100) == 10.0
+
+
+def test_replay_synthetic_script():
+    random.seed(0)
+    script = synthetic_script(Board(), solve=False)
+
+    report = replay(script, seed=0)
+
+    assert report.frames > 0
+    assert report.frames == len(report.frame_times)
+    assert report.cpu_time > 0